@@ -7,6 +7,7 @@ This test verifies that our row-level locking prevents both:
 """
 
 import json
+import re
 import threading
 import time
 import queue
@@ -18,13 +19,20 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Setup Django settings
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'receipt_splitter.settings')
-import django
-django.setup()
-
 from integration_test.base_test import IntegrationTestBase
 
+_ITEM_ID_RE = re.compile(rb'data-item-id="([^"]+)"')
+
+
+def _ensure_django() -> None:
+    """Set up Django for standalone runs; pytest-django has already done it."""
+    from django.apps import apps
+    if apps.ready:
+        return
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'receipt_splitter.settings')
+    import django
+    django.setup()
+
 
 class ConcurrentClaimsTest:
     def __init__(self, base_url: str = "http://localhost:8000"):
@@ -54,10 +62,9 @@ class ConcurrentClaimsTest:
         if edit_response.status_code != 200:
             raise Exception(f"Failed to get edit page: {edit_response.status_code}")
 
-        # Parse item IDs from the edit page (looking for data-item-id attributes)
-        content = edit_response.content.decode('utf-8')
-        import re
-        item_ids = re.findall(r'data-item-id="([^"]+)"', content)
+        # Only the first item is used, so stop at the first data-item-id attribute
+        match = _ITEM_ID_RE.search(edit_response.content)
+        item_ids = [match.group(1).decode()] if match else []
 
         # Update the first item to have limited quantity
         if item_ids:
@@ -335,5 +342,6 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Run tests
+    _ensure_django()
     test = ConcurrentClaimsTest()
     test.run_all_tests()
\ No newline at end of file
@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import Generator, Tuple
 
 import pytest
+from django.core.cache import cache
+from django.test.client import ClientHandler
 
 from integration_test.base_test import IntegrationTestBase
 from integration_test.mock_ocr import patch_ocr_for_tests
@@ -24,10 +26,24 @@ def patch_mock_ocr() -> Generator[None, None, None]:
             patch.stop()
 
 
+@pytest.fixture(scope="session")
+def _client_handler() -> ClientHandler:
+    """Request handler shared by every test client, so middleware loads once."""
+    return ClientHandler(enforce_csrf_checks=False)
+
+
 @pytest.fixture
-def integration_client(db) -> IntegrationTestBase:
-    """Return a fresh integration test client for each test."""
-    return IntegrationTestBase()
+def integration_client(db, _client_handler: ClientHandler) -> IntegrationTestBase:
+    """Return a fresh integration test client for each test.
+
+    Requesting ``db`` runs the test inside a transaction that pytest-django
+    rolls back afterwards, so receipts created over HTTP never need a manual
+    ``Receipt.objects.filter(...).delete()`` cleanup. Cookies live on the
+    client, so each test still starts with an empty session.
+    """
+    client = IntegrationTestBase()
+    client.client.handler = _client_handler
+    return client
 
 
 @pytest.fixture(scope="session")
@@ -37,11 +53,36 @@ def heic_fixture_bytes() -> bytes:
     return image_path.read_bytes()
 
 
+@pytest.fixture(scope="module")
+def _finalized_receipt_template(django_db_setup, django_db_blocker) -> Generator[Tuple[str, dict, list[int]], None, None]:
+    """Build one finalized receipt per module, committed outside any test transaction.
+
+    Module scope deletes the committed receipt as soon as the module that uses
+    it finishes, so it is never visible to unrelated tests later in the run
+    (e.g. ``receipts/`` TestCases that count or list receipts).
+    """
+    from receipts.models import Receipt
+
+    with django_db_blocker.unblock():
+        slug, receipt_data, item_ids = _create_finalized_receipt(IntegrationTestBase())
+        try:
+            yield slug, receipt_data, item_ids
+        finally:
+            Receipt.objects.filter(slug=slug).delete()
+
+
 @pytest.fixture
-def finalized_receipt(integration_client: IntegrationTestBase, db) -> Tuple[str, dict, list[int]]:
-    """Create, balance, and finalize a receipt for claim-related tests."""
-    slug, receipt_data, item_ids = _create_finalized_receipt(integration_client)
-    return slug, receipt_data, item_ids
+def finalized_receipt(_finalized_receipt_template, db) -> Generator[Tuple[str, dict, list[int]], None, None]:
+    """Finalized, balanced receipt for claim-related tests.
+
+    The receipt itself is built once per module. Claims, viewer names and
+    claim finalizations a test makes are rolled back with its ``db``
+    transaction, but the claim caches (participant totals, receipt view) are
+    not, so they are cleared around each test.
+    """
+    cache.clear()
+    yield _finalized_receipt_template
+    cache.clear()
 
 
 def _create_finalized_receipt(client: IntegrationTestBase) -> Tuple[str, dict, list[int]]:
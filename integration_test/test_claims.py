@@ -12,15 +12,29 @@ from integration_test.base_test import IntegrationTestBase
 
 pytestmark = pytest.mark.integration
 
+# Under ``pytest -n auto --dist loadgroup`` keep the tests on the module's
+# receipt on one worker so ``finalized_receipt`` is only built once.
+_finalized_receipt_group = pytest.mark.xdist_group("finalized_receipt")
 
+
+def _status(session: IntegrationTestBase, slug: str) -> dict:
+    """GET the claim-status poll endpoint and return its parsed payload."""
+    response = session.client.get(f"/claim/{slug}/status/")
+    assert response.status_code == 200
+    return response.json()
+
+
+def _by_id(payload: dict) -> dict[str, dict]:
+    """Index a status payload's items_with_claims by item_id."""
+    return {item["item_id"]: item for item in payload["items_with_claims"]}
+
+
+@_finalized_receipt_group
 def test_polling_endpoint_returns_expected_structure(
     integration_client: IntegrationTestBase, finalized_receipt
 ) -> None:
     slug, _, _ = finalized_receipt
-    response = integration_client.client.get(f"/claim/{slug}/status/")
-    assert response.status_code == 200
-
-    payload = json.loads(response.content)
+    payload = _status(integration_client, slug)
     assert payload["success"] is True
 
     for field in ["participant_totals", "total_claimed", "total_unclaimed", "my_total", "items_with_claims"]:
@@ -29,6 +43,7 @@ def test_polling_endpoint_returns_expected_structure(
     assert isinstance(payload["items_with_claims"], list)
 
 
+@_finalized_receipt_group
 def test_claim_updates_are_visible_to_other_sessions(
     integration_client: IntegrationTestBase, finalized_receipt
 ) -> None:
@@ -43,24 +58,24 @@ def test_claim_updates_are_visible_to_other_sessions(
     claim = alice.claim_item(slug, item_ids[0], quantity=1)
     assert claim["status_code"] == 200
 
-    status = bob.client.get(f"/claim/{slug}/status/")
-    assert status.status_code == 200
-    payload = json.loads(status.content)
+    payload = _status(bob, slug)
 
     participants = {entry["name"] for entry in payload["participant_totals"]}
     assert "Alice" in participants
 
-    claimed_item = next(item for item in payload["items_with_claims"] if item["item_id"] == str(item_ids[0]))
+    claimed_item = _by_id(payload)[str(item_ids[0])]
     assert claimed_item["claims"]
     assert claimed_item["claims"][0]["claimer_name"] == "Alice"
     assert claimed_item["claims"][0]["quantity_claimed"] == 1
     assert claimed_item["available_quantity"] >= 0
 
 
+@_finalized_receipt_group
 def test_real_time_availability_updates(
     integration_client: IntegrationTestBase, finalized_receipt
 ) -> None:
     slug, _, item_ids = finalized_receipt
+    item_key = str(item_ids[0])
 
     alice = integration_client.create_new_session()
     bob = integration_client.create_new_session()
@@ -68,25 +83,22 @@ def test_real_time_availability_updates(
     assert alice.set_viewer_name(slug, "Alice")
     assert bob.set_viewer_name(slug, "Bob")
 
-    initial = bob.client.get(f"/claim/{slug}/status/")
-    assert initial.status_code == 200
-    initial_payload = json.loads(initial.content)
-    target = next(item for item in initial_payload["items_with_claims"] if item["item_id"] == str(item_ids[0]))
+    initial_payload = _status(bob, slug)
+    target = _by_id(initial_payload)[item_key]
     available_before = target["available_quantity"]
     assert available_before > 0
 
     claim = alice.claim_item(slug, item_ids[0], quantity=available_before)
     assert claim["status_code"] == 200
 
-    updated = bob.client.get(f"/claim/{slug}/status/")
-    assert updated.status_code == 200
-    updated_payload = json.loads(updated.content)
-    updated_item = next(item for item in updated_payload["items_with_claims"] if item["item_id"] == str(item_ids[0]))
+    updated_payload = _status(bob, slug)
+    updated_item = _by_id(updated_payload)[item_key]
     assert updated_item["available_quantity"] == 0
     assert len(updated_item["claims"]) == 1
     assert updated_item["claims"][0]["quantity_claimed"] == available_before
 
 
+@_finalized_receipt_group
 def test_participant_totals_update(
     integration_client: IntegrationTestBase, finalized_receipt
 ) -> None:
@@ -109,9 +121,7 @@ def test_participant_totals_update(
         assert result["status_code"] == 200
 
     for viewer, session in sessions.items():
-        status = session.client.get(f"/claim/{slug}/status/")
-        assert status.status_code == 200
-        payload = json.loads(status.content)
+        payload = _status(session, slug)
 
         participants = {entry["name"] for entry in payload["participant_totals"]}
         assert participants.issuperset(sessions.keys())
@@ -121,6 +131,7 @@ def test_participant_totals_update(
                 assert Decimal(str(entry["amount"])) > Decimal("0")
 
 
+@_finalized_receipt_group
 def test_concurrent_claim_conflicts(
     integration_client: IntegrationTestBase, finalized_receipt
 ) -> None:
@@ -132,16 +143,15 @@ def test_concurrent_claim_conflicts(
     assert alice.set_viewer_name(slug, "Alice")
     assert bob.set_viewer_name(slug, "Bob")
 
-    status = alice.client.get(f"/claim/{slug}/status/")
-    assert status.status_code == 200
-    payload = json.loads(status.content)
+    payload = _status(alice, slug)
 
     try:
         target = next(item for item in payload["items_with_claims"] if item["available_quantity"] > 1)
     except StopIteration:
         target = payload["items_with_claims"][0]
 
-    target_id = int(target["item_id"])
+    item_key = target["item_id"]
+    target_id = int(item_key)
 
     alice_response = alice.claim_item(slug, target_id, quantity=1)
     bob_response = bob.claim_item(slug, target_id, quantity=1)
@@ -149,15 +159,14 @@ def test_concurrent_claim_conflicts(
     assert alice_response["status_code"] == 200
     assert bob_response["status_code"] == 200
 
-    final_status = alice.client.get(f"/claim/{slug}/status/")
-    assert final_status.status_code == 200
-    final_payload = json.loads(final_status.content)
-    final_item = next(item for item in final_payload["items_with_claims"] if item["item_id"] == str(target_id))
+    final_payload = _status(alice, slug)
+    final_item = _by_id(final_payload)[item_key]
 
     total_claimed = sum(claim["quantity_claimed"] for claim in final_item["claims"])
     assert total_claimed >= 1
 
 
+@_finalized_receipt_group
 def test_polling_endpoint_rate_limiting(
     integration_client: IntegrationTestBase, finalized_receipt
 ) -> None:
@@ -176,6 +185,7 @@ def test_polling_with_invalid_receipt(integration_client: IntegrationTestBase) -
     assert response.status_code == 404
 
 
+@_finalized_receipt_group
 def test_kuizy_fries_regression_scenario(
     integration_client: IntegrationTestBase, finalized_receipt
 ) -> None:
@@ -185,19 +195,19 @@ def test_kuizy_fries_regression_scenario(
     assert kuizy.set_viewer_name(slug, "kuizy")
 
     target_item_id = item_ids[1]
+    item_key = str(target_item_id)
 
     first_claim = kuizy.claim_item(slug, target_item_id, quantity=1)
     assert first_claim["status_code"] == 200
 
-    status = kuizy.client.get(f"/claim/{slug}/status/")
-    payload = json.loads(status.content)
-    item_payload = next(item for item in payload["items_with_claims"] if item["item_id"] == str(target_item_id))
+    payload = _status(kuizy, slug)
+    item_payload = _by_id(payload)[item_key]
     kuizy_claim = next(claim for claim in item_payload["claims"] if claim["claimer_name"] == "kuizy")
     assert kuizy_claim["quantity_claimed"] == 1
     assert item_payload["available_quantity"] == 1
 
     total_claim = {
-        "claims": [{"line_item_id": str(target_item_id), "quantity": 2}],
+        "claims": [{"line_item_id": item_key, "quantity": 2}],
     }
     response = kuizy.client.post(
         f"/claim/{slug}/",
@@ -217,24 +227,25 @@ def test_kuizy_fries_regression_scenario(
         expected_quantity = 1
         expected_available = 1
 
-    final_status = kuizy.client.get(f"/claim/{slug}/status/")
-    final_payload = json.loads(final_status.content)
-    final_item = next(item for item in final_payload["items_with_claims"] if item["item_id"] == str(target_item_id))
+    final_payload = _status(kuizy, slug)
+    final_item = _by_id(final_payload)[item_key]
     final_claim = next(claim for claim in final_item["claims"] if claim["claimer_name"] == "kuizy")
     assert final_claim["quantity_claimed"] == expected_quantity
     assert final_item["available_quantity"] == expected_available
     assert final_payload["is_finalized"] is True
 
 
+@_finalized_receipt_group
 def test_finalization_prevents_further_changes(
     integration_client: IntegrationTestBase, finalized_receipt
 ) -> None:
     slug, _, item_ids = finalized_receipt
+    item_key = str(item_ids[0])
 
     session = integration_client.create_new_session()
     assert session.set_viewer_name(slug, "Finalizer")
 
-    finalize_data = {"claims": [{"line_item_id": str(item_ids[0]), "quantity": 1}]}
+    finalize_data = {"claims": [{"line_item_id": item_key, "quantity": 1}]}
     response = session.client.post(
         f"/claim/{slug}/",
         data=json.dumps(finalize_data),
@@ -253,14 +264,14 @@ def test_finalization_prevents_further_changes(
     error = json.loads(second.content)
     assert "error" in error
 
-    status = session.client.get(f"/claim/{slug}/status/")
-    payload = json.loads(status.content)
+    payload = _status(session, slug)
     assert payload["is_finalized"] is True
-    item_data = next(item for item in payload["items_with_claims"] if item["item_id"] == str(item_ids[0]))
+    item_data = _by_id(payload)[item_key]
     claim_record = next(claim for claim in item_data["claims"] if claim["claimer_name"] == "Finalizer")
     assert claim_record["quantity_claimed"] == 1
 
 
+@_finalized_receipt_group
 def test_polling_includes_finalization_status(
     integration_client: IntegrationTestBase, finalized_receipt
 ) -> None:
@@ -269,9 +280,7 @@ def test_polling_includes_finalization_status(
     session = integration_client.create_new_session()
     assert session.set_viewer_name(slug, "PollingUser")
 
-    initial = session.client.get(f"/claim/{slug}/status/")
-    assert initial.status_code == 200
-    initial_payload = json.loads(initial.content)
+    initial_payload = _status(session, slug)
     assert "is_finalized" in initial_payload
     assert initial_payload["is_finalized"] is False
 
@@ -282,7 +291,5 @@ def test_polling_includes_finalization_status(
         content_type="application/json",
     )
 
-    final = session.client.get(f"/claim/{slug}/status/")
-    assert final.status_code == 200
-    final_payload = json.loads(final.content)
+    final_payload = _status(session, slug)
     assert final_payload["is_finalized"] is True
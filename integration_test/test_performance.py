@@ -11,16 +11,13 @@ pytestmark = pytest.mark.integration
 
 
 def test_large_receipt_performance(integration_client: IntegrationTestBase) -> None:
-    upload = integration_client.upload_receipt("Performance Tester")
-    slug = upload["receipt_slug"]
-    assert slug
-    assert integration_client.wait_for_processing(slug)
+    slug = integration_client.setup_receipt("Performance Tester")
 
     payload = IntegrationTestBase.TestData.large_receipt(50)
 
-    start = time.time()
+    start = time.perf_counter()
     update = integration_client.update_receipt(slug, payload)
-    update_duration = time.time() - start
+    update_duration = time.perf_counter() - start
     assert update["status_code"] == 200
     assert update_duration < 5
 
@@ -42,13 +39,13 @@ def test_large_receipt_performance(integration_client: IntegrationTestBase) -> N
         ]
     }
 
-    claim_start = time.time()
+    claim_start = time.perf_counter()
     response = integration_client.client.post(
         f"/claim/{slug}/",
         data=json.dumps(claim_payload),
         content_type="application/json",
     )
-    claim_duration = time.time() - claim_start
+    claim_duration = time.perf_counter() - claim_start
     assert response.status_code == 200
     result = json.loads(response.content)
     assert result["success"] is True
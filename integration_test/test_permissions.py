@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 from decimal import Decimal
 
 import pytest
@@ -16,10 +17,7 @@ def test_claims_blocked_before_finalization(
     integration_client: IntegrationTestBase,
 ) -> None:
     uploader = integration_client.create_new_session()
-    upload = uploader.upload_receipt("Uploader")
-    slug = upload["receipt_slug"]
-    assert slug
-    assert uploader.wait_for_processing(slug)
+    slug = uploader.setup_receipt("Uploader")
 
     receipt = uploader.get_receipt_data(slug)
     item_id = receipt["items"][0]["id"]
@@ -35,10 +33,7 @@ def test_claims_blocked_before_finalization(
 
 def test_name_based_claim_calculations(integration_client: IntegrationTestBase) -> None:
     uploader = integration_client.create_new_session()
-    upload = uploader.upload_receipt("Restaurant Owner")
-    slug = upload["receipt_slug"]
-    assert slug
-    assert uploader.wait_for_processing(slug)
+    slug = uploader.setup_receipt("Restaurant Owner")
 
     test_data = IntegrationTestBase.TestData.balanced_receipt()
     test_data.update(
@@ -66,8 +61,8 @@ def test_name_based_claim_calculations(integration_client: IntegrationTestBase)
     assert kui.set_viewer_name(slug, "Kui")
 
     receipt_data = kui.get_receipt_data(slug)
-    paloma_id = next(item["id"] for item in receipt_data["items"] if item["name"] == "PALOMA")
-    claim = kui.claim_item(slug, paloma_id, quantity=1)
+    ids_by_name = {item["name"]: item["id"] for item in receipt_data["items"]}
+    claim = kui.claim_item(slug, ids_by_name["PALOMA"], quantity=1)
     assert claim["status_code"] == 200
     kui_total = Decimal(str(claim["data"]["my_total"]))
     assert kui_total == Decimal("17.68")
@@ -77,8 +72,8 @@ def test_name_based_claim_calculations(integration_client: IntegrationTestBase)
 
     bulk_claim = {
         "claims": [
-            {"line_item_id": next(item["id"] for item in receipt_data["items"] if item["name"] == "HAPPY HOUR BEER"), "quantity": 1},
-            {"line_item_id": next(item["id"] for item in receipt_data["items"] if item["name"] == "WELL TEQUILA"), "quantity": 1},
+            {"line_item_id": ids_by_name["HAPPY HOUR BEER"], "quantity": 1},
+            {"line_item_id": ids_by_name["WELL TEQUILA"], "quantity": 1},
         ]
     }
 
@@ -90,31 +85,22 @@ def test_name_based_claim_calculations(integration_client: IntegrationTestBase)
     assert response.status_code == 200
 
     final_state = kui.get_receipt_data(slug)
-    kui_claims = [
-        Decimal(str(claim_entry["share_amount"]))
-        for item in final_state["items"]
-        for claim_entry in item.get("claims", [])
-        if claim_entry["claimer_name"] == "Kui"
-    ]
-    kui5_claims = [
-        Decimal(str(claim_entry["share_amount"]))
-        for item in final_state["items"]
-        for claim_entry in item.get("claims", [])
-        if claim_entry["claimer_name"] == "Kui 5"
-    ]
-
-    assert sum(kui_claims) == Decimal("17.68")
-    assert sum(kui5_claims) == Decimal("10.40")
+    claims_by_name = defaultdict(list)
+    for item in final_state["items"]:
+        for claim_entry in item.get("claims", []):
+            claims_by_name[claim_entry["claimer_name"]].append(
+                Decimal(str(claim_entry["share_amount"]))
+            )
+
+    assert sum(claims_by_name["Kui"]) == Decimal("17.68")
+    assert sum(claims_by_name["Kui 5"]) == Decimal("10.40")
 
 
 def test_uploader_permissions_survive_name_change(
     integration_client: IntegrationTestBase,
 ) -> None:
     uploader = integration_client.create_new_session()
-    upload = uploader.upload_receipt("Original Uploader")
-    slug = upload["receipt_slug"]
-    assert slug
-    assert uploader.wait_for_processing(slug)
+    slug = uploader.setup_receipt("Original Uploader")
 
     payload = IntegrationTestBase.TestData.balanced_receipt()
     update = uploader.update_receipt(slug, payload)
@@ -128,11 +114,12 @@ def test_uploader_permissions_survive_name_change(
         session.save()
 
     payload["restaurant_name"] = "Updated Restaurant"
-    update = uploader.update_receipt(slug, payload)
+    body = json.dumps(payload).encode()
+    update = uploader.update_receipt(slug, body)
     assert update["status_code"] == 200
 
     intruder = integration_client.create_new_session()
-    response = intruder.update_receipt(slug, payload)
+    response = intruder.update_receipt(slug, body)
     assert response["status_code"] == 403
 
     finalize = uploader.finalize_receipt(slug)
@@ -143,21 +130,18 @@ def test_session_isolation_and_finalization_redirect(
     integration_client: IntegrationTestBase,
 ) -> None:
     owner = integration_client.create_new_session()
-    upload = owner.upload_receipt("Owner")
-    slug = upload["receipt_slug"]
-    assert slug
-    assert owner.wait_for_processing(slug)
+    slug = owner.setup_receipt("Owner")
 
-    payload = IntegrationTestBase.TestData.balanced_receipt()
+    body = json.dumps(IntegrationTestBase.TestData.balanced_receipt()).encode()
     intruder = integration_client.create_new_session()
 
-    unauthorized_update = intruder.update_receipt(slug, payload)
+    unauthorized_update = intruder.update_receipt(slug, body)
     assert unauthorized_update["status_code"] == 403
 
     unauthorized_finalize = intruder.finalize_receipt(slug)
     assert unauthorized_finalize["status_code"] == 403
 
-    authorized_update = owner.update_receipt(slug, payload)
+    authorized_update = owner.update_receipt(slug, body)
     assert authorized_update["status_code"] == 200
 
     finalize = owner.finalize_receipt(slug)
@@ -169,10 +153,7 @@ def test_session_isolation_and_finalization_redirect(
 
 def test_session_hijacking_blocked(integration_client: IntegrationTestBase) -> None:
     owner = integration_client.create_new_session()
-    upload = owner.upload_receipt("Owner Second")
-    slug = upload["receipt_slug"]
-    assert slug
-    assert owner.wait_for_processing(slug)
+    slug = owner.setup_receipt("Owner Second")
 
     intruder = integration_client.create_new_session()
     session = intruder.client.session
@@ -186,29 +167,27 @@ def test_session_hijacking_blocked(integration_client: IntegrationTestBase) -> N
 
 def test_concurrent_edit_protection(integration_client: IntegrationTestBase) -> None:
     owner = integration_client.create_new_session()
-    upload = owner.upload_receipt("Owner Third")
-    slug = upload["receipt_slug"]
-    assert slug
-    assert owner.wait_for_processing(slug)
+    slug = owner.setup_receipt("Owner Third")
+
+    # update_receipt serializes at call time, so one payload can be reused
+    # (and re-labelled) across requests
+    payload = IntegrationTestBase.TestData.balanced_receipt()
+    body = json.dumps(payload).encode()
 
     authorized_results = []
     for _ in range(3):
-        payload = IntegrationTestBase.TestData.balanced_receipt()
-        response = owner.update_receipt(slug, payload)
+        response = owner.update_receipt(slug, body)
         authorized_results.append(response["status_code"])
 
     assert authorized_results.count(200) == 3
 
     intruder = integration_client.create_new_session()
 
-    owner_payload = IntegrationTestBase.TestData.balanced_receipt()
-    owner_payload["restaurant_name"] = "User A Edit"
-
-    intruder_payload = IntegrationTestBase.TestData.balanced_receipt()
-    intruder_payload["restaurant_name"] = "User B Edit"
+    payload["restaurant_name"] = "User A Edit"
+    owner_result = owner.update_receipt(slug, payload)
 
-    owner_result = owner.update_receipt(slug, owner_payload)
-    intruder_result = intruder.update_receipt(slug, intruder_payload)
+    payload["restaurant_name"] = "User B Edit"
+    intruder_result = intruder.update_receipt(slug, payload)
 
     assert owner_result["status_code"] == 200
     assert intruder_result["status_code"] == 403
@@ -8,10 +8,7 @@ pytestmark = pytest.mark.integration
 
 
 def test_balance_validation(integration_client: IntegrationTestBase) -> None:
-    upload = integration_client.upload_receipt("Validation Tester")
-    slug = upload["receipt_slug"]
-    assert slug
-    assert integration_client.wait_for_processing(slug)
+    slug = integration_client.setup_receipt("Validation Tester")
 
     cases = [
         ("balanced receipt", IntegrationTestBase.TestData.balanced_receipt(), True),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from decimal import Decimal
 
 import pytest
@@ -85,28 +86,21 @@ def test_complete_receipt_workflow(
 
 def test_edit_requires_session_owner(integration_client: IntegrationTestBase) -> None:
     """Ensure only the uploading session can edit the receipt."""
-    upload = integration_client.upload_receipt("Owner Session")
-    slug = upload["receipt_slug"]
-    assert slug
-    assert integration_client.wait_for_processing(slug)
+    slug = integration_client.setup_receipt("Owner Session")
 
-    payload = IntegrationTestBase.TestData.balanced_receipt()
-    update = integration_client.update_receipt(slug, payload)
+    body = json.dumps(IntegrationTestBase.TestData.balanced_receipt()).encode()
+    update = integration_client.update_receipt(slug, body)
     assert update["status_code"] == 200
 
     intruder = integration_client.create_new_session()
-    response = intruder.update_receipt(slug, payload)
+    response = intruder.update_receipt(slug, body)
     assert response["status_code"] == 403
 
 
 def test_image_accessible_before_and_after_finalization(integration_client: IntegrationTestBase) -> None:
     """Receipt images persist after finalisation (purged by future cronjob, not on finalize)."""
 
-    upload = integration_client.upload_receipt("Image Cleanup Tester")
-    slug = upload["receipt_slug"]
-    assert slug
-
-    assert integration_client.wait_for_processing(slug)
+    slug = integration_client.setup_receipt("Image Cleanup Tester")
 
     # Image is served as a presigned-URL redirect (302) — never proxied directly
     before = integration_client.client.get(f"/image/{slug}/")
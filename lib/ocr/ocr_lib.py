@@ -102,6 +102,9 @@ _MIME_MAP = {
     ".webp": "image/webp",
 }
 
+# JPEG segments that carry no metadata worth stripping (JFIF, Adobe)
+_JPEG_PASSTHROUGH_MARKERS = {"APP0", "APP14"}
+
 # Map PIL format names to save kwargs
 _PIL_FORMAT_MAP = {
     "JPEG": {"format": "JPEG", "quality": 85},
@@ -180,7 +183,10 @@ class ReceiptOCR:
         self.thinking_level = thinking_level
 
     def _prepare_image(self, raw_bytes: bytes, mime_type: str) -> tuple:
-        """Prepare image bytes: EXIF rotate only, preserve original format.
+        """Prepare image bytes: EXIF rotate and re-encode in the original format.
+
+        A JPEG re-encode drops EXIF, XMP, ICC and comments. A JPEG that
+        carries none of them is sent as-is when no larger than its re-encode.
 
         Args:
             raw_bytes: Raw image bytes
@@ -191,6 +197,14 @@ class ReceiptOCR:
         """
         image = Image.open(BytesIO(raw_bytes))
 
+        # Only a real JPEG declared as JPEG whose sole segments are JFIF
+        # (APP0) and Adobe colour info (APP14) may skip the re-encode; EXIF,
+        # XMP, ICC, comments and IPTC (APP13) must not reach the API.
+        passthrough = (
+            image.format == 'JPEG' and mime_type == 'image/jpeg'
+            and all(marker in _JPEG_PASSTHROUGH_MARKERS for marker, _ in image.applist)
+        )
+
         # Apply EXIF rotation
         try:
             rotated = ImageOps.exif_transpose(image)
@@ -199,6 +213,9 @@ class ReceiptOCR:
         except Exception as e:
             logger.debug(f"Could not auto-rotate image: {e}")
 
+        # Pillow copies a JPEG comment into the re-encode unless it is dropped
+        image.info.pop("comment", None)
+
         # Save back in original format
         pil_format = _mime_to_pil_format(mime_type)
         save_kwargs = _PIL_FORMAT_MAP.get(pil_format, {"format": "JPEG"})
@@ -206,7 +223,7 @@ class ReceiptOCR:
         buffer = BytesIO()
         try:
             image.save(buffer, **save_kwargs)
-            return buffer.getvalue(), mime_type
+            processed_mime = mime_type
         except Exception:
             # Fallback: if saving in original format fails (e.g., HEIF write not supported),
             # convert to JPEG
@@ -215,7 +232,12 @@ class ReceiptOCR:
             if image.mode not in ('RGB', 'L'):
                 image = image.convert('RGB')
             image.save(buffer, format='JPEG', quality=85)
-            return buffer.getvalue(), "image/jpeg"
+            processed_mime = "image/jpeg"
+
+        processed_bytes = buffer.getvalue()
+        if passthrough and len(raw_bytes) <= len(processed_bytes):
+            return raw_bytes, mime_type
+        return processed_bytes, processed_mime
 
     def _create_prompt(self) -> str:
         """Create the prompt for Gemini Vision API (v5_aligned, hardcoded)"""
@@ -324,7 +346,7 @@ OUTPUT:
             else:
                 mime_type = "image/jpeg"
 
-        # EXIF rotate, preserve original format
+        # EXIF rotate and strip metadata, keeping the smaller payload
         processed_bytes, processed_mime = self._prepare_image(raw_bytes, mime_type)
 
         # Make the API call
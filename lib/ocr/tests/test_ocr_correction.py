@@ -9,8 +9,10 @@ from decimal import Decimal
 from datetime import datetime
 import sys
 from pathlib import Path
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# pytest (pythonpath = . in pytest.ini) and `python -m unittest` already have
+# the repo root importable; only a direct `python path/to/this_file.py` needs it
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
 from lib.ocr.ocr_lib import ReceiptData, LineItem
 
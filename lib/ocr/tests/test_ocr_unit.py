@@ -13,13 +13,27 @@ import json
 
 import sys
 from pathlib import Path
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# pytest (pythonpath = . in pytest.ini) and `python -m unittest` already have
+# the repo root importable; only a direct `python path/to/this_file.py` needs it
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
 from lib.ocr.ocr_lib import ReceiptOCR
 from lib.ocr.models import ReceiptData, LineItem
 
 
+def _encode_test_jpeg():
+    """Minimal valid JPEG for PIL to open; the content never matters."""
+    from PIL import Image
+    from io import BytesIO
+    buffer = BytesIO()
+    Image.new('RGB', (10, 10), color='white').save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+
+_TEST_JPEG_BYTES = _encode_test_jpeg()
+
+
 class TestLineItem(unittest.TestCase):
     """Test LineItem Pydantic model"""
 
@@ -229,6 +243,73 @@ class TestReceiptOCR(unittest.TestCase):
         self.assertEqual(result_mime, "image/jpeg")
         self.assertGreater(len(result_bytes), 0)
 
+    @patch('lib.ocr.ocr_lib.genai.Client')
+    def test_prepare_image_passes_plain_jpeg_through(self, mock_genai_client):
+        """A metadata-free JPEG no larger than its re-encode is sent as-is"""
+        ocr = ReceiptOCR("test_key", )
+        result_bytes, result_mime = ocr._prepare_image(_TEST_JPEG_BYTES, "image/jpeg")
+
+        self.assertEqual(result_bytes, _TEST_JPEG_BYTES)
+        self.assertEqual(result_mime, "image/jpeg")
+
+    @patch('lib.ocr.ocr_lib.genai.Client')
+    def test_prepare_image_reencodes_larger_plain_jpeg(self, mock_genai_client):
+        """A metadata-free JPEG bigger than its re-encode is replaced by it"""
+        from PIL import Image
+        from io import BytesIO
+
+        buffer = BytesIO()
+        Image.effect_noise((64, 64), 64).convert('RGB').save(buffer, format='JPEG', quality=100)
+        raw = buffer.getvalue()
+
+        ocr = ReceiptOCR("test_key", )
+        result_bytes, result_mime = ocr._prepare_image(raw, "image/jpeg")
+
+        self.assertLess(len(result_bytes), len(raw))
+        self.assertEqual(result_mime, "image/jpeg")
+
+    @patch('lib.ocr.ocr_lib.genai.Client')
+    def test_prepare_image_reencodes_non_jpeg_declared_as_jpeg(self, mock_genai_client):
+        """process_image(bytes) labels everything image/jpeg, so other formats must be re-encoded"""
+        from PIL import Image
+        from io import BytesIO
+
+        ocr = ReceiptOCR("test_key", )
+        for fmt, mode in (('PNG', 'RGBA'), ('WEBP', 'RGB'), ('HEIF', 'RGB')):
+            with self.subTest(fmt=fmt):
+                buffer = BytesIO()
+                Image.new(mode, (10, 10), color='white').save(buffer, format=fmt)
+                raw = buffer.getvalue()
+
+                result_bytes, result_mime = ocr._prepare_image(raw, "image/jpeg")
+
+                self.assertEqual(result_mime, "image/jpeg")
+                self.assertEqual(Image.open(BytesIO(result_bytes)).format, 'JPEG')
+
+    @patch('lib.ocr.ocr_lib.genai.Client')
+    def test_prepare_image_strips_jpeg_metadata(self, mock_genai_client):
+        """JPEGs carrying EXIF (e.g. GPS), ICC or comments are re-encoded without it"""
+        from PIL import Image
+        from io import BytesIO
+
+        img = Image.new('RGB', (10, 10), color='white')
+        exif = img.getexif()
+        exif[0x0131] = 'Test Camera'  # Software
+
+        ocr = ReceiptOCR("test_key", )
+        for key, value in (('exif', exif), ('icc_profile', b'\0' * 128), ('comment', b'shot on')):
+            with self.subTest(metadata=key):
+                buffer = BytesIO()
+                img.save(buffer, format='JPEG', **{key: value})
+                raw = buffer.getvalue()
+
+                result_bytes, result_mime = ocr._prepare_image(raw, "image/jpeg")
+
+                self.assertNotEqual(result_bytes, raw)
+                self.assertEqual(result_mime, "image/jpeg")
+                result = Image.open(BytesIO(result_bytes))
+                self.assertEqual([marker for marker, _ in result.applist], ['APP0'])
+
     @patch('lib.ocr.ocr_lib.Image.open')
     def test_process_image_file_not_found(self, mock_open):
         ocr = ReceiptOCR("test_key", )
@@ -266,15 +347,7 @@ class TestIntegration(unittest.TestCase):
         # Test - use bytes to avoid file system checks
         ocr = ReceiptOCR("test_key", model="gemini-3-flash-preview", )
 
-        # Create a minimal valid JPEG for PIL to open
-        from PIL import Image
-        from io import BytesIO
-        img = Image.new('RGB', (10, 10), color='white')
-        buffer = BytesIO()
-        img.save(buffer, format='JPEG')
-        dummy_image = buffer.getvalue()
-
-        receipt = ocr.process_image(dummy_image)
+        receipt = ocr.process_image(_TEST_JPEG_BYTES)
 
         # Verify result
         self.assertEqual(receipt.restaurant_name, 'Test Restaurant')
@@ -296,15 +369,8 @@ class TestIntegration(unittest.TestCase):
         # Test
         ocr = ReceiptOCR("test_key", )
 
-        # Create a minimal valid JPEG for PIL to open
-        from PIL import Image
-        from io import BytesIO
-        img = Image.new('RGB', (10, 10), color='white')
-        buffer = BytesIO()
-        img.save(buffer, format='JPEG')
-
         with self.assertRaises(ValueError) as context:
-            ocr.process_image(buffer.getvalue())
+            ocr.process_image(_TEST_JPEG_BYTES)
 
         self.assertIn("Failed to process image with Gemini", str(context.exception))
 
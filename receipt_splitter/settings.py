@@ -209,6 +209,11 @@ CACHES = {
     }
 }
 
+# Seconds to cache /status/<slug>/ poll results (0 disables). The OCR worker
+# writes each new status into the cache; LocMemCache is per-process, so a poll
+# served by another worker process can lag by up to this many seconds.
+PROCESSING_STATUS_CACHE_TTL = int(os.getenv('PROCESSING_STATUS_CACHE_TTL', '1'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
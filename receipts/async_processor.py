@@ -6,6 +6,8 @@ Handles background processing of uploaded receipts
 import logging
 import threading
 from decimal import Decimal
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from .models import Receipt, LineItem, ReceiptOCRResult, ReceiptOCRLineItem
 from .ocr_service import process_receipt_with_ocr
@@ -15,6 +17,22 @@ from .image_storage import store_receipt_image
 logger = logging.getLogger(__name__)
 
 
+def processing_status_cache_key(slug):
+    """Cache key for the short-lived /status/<slug>/ poll result"""
+    return f"receipt_status:{slug}"
+
+
+def _cache_processing_status(receipt):
+    """Write the receipt's new status into the /status/<slug>/ poll cache"""
+    ttl = settings.PROCESSING_STATUS_CACHE_TTL
+    if ttl:
+        cache.set(
+            processing_status_cache_key(receipt.slug),
+            (receipt.processing_status, receipt.processing_error),
+            ttl,
+        )
+
+
 def process_receipt_async(receipt_id, original_image_file):
     """
     Process receipt OCR in a background thread
@@ -58,6 +76,7 @@ def _process_receipt_worker(receipt_id, image_content, format_hint="JPEG"):
         # Update status to processing
         receipt.processing_status = 'processing'
         receipt.save(update_fields=['processing_status'])
+        _cache_processing_status(receipt)
         logger.info(f"Processing receipt {receipt_id}")
         
         # Process with OCR (pass format hint for proper handling)
@@ -72,6 +91,7 @@ def _process_receipt_worker(receipt_id, image_content, format_hint="JPEG"):
         receipt.total = Decimal(str(ocr_data['total']))
         receipt.processing_status = 'completed'
         receipt.save()
+        _cache_processing_status(receipt)
         
         # Delete existing placeholder items
         receipt.items.all().delete()
@@ -122,6 +142,7 @@ def _process_receipt_worker(receipt_id, image_content, format_hint="JPEG"):
             receipt.processing_status = 'failed'
             receipt.processing_error = "An unexpected error occurred during processing."
             receipt.save(update_fields=['processing_status', 'processing_error'])
+            _cache_processing_status(receipt)
         except Exception as update_e:
             logger.error(f"Failed to update receipt status for {receipt_id}: {update_e}")
 
@@ -27,12 +27,21 @@ MIME_TO_FORMAT_HINT = {
 }
 
 
+# libmagic only needs the start of the file to identify it
+MIME_SNIFF_BYTES = 8192
+
+
+def _sniff_mime(data):
+    """Detect MIME type from the leading bytes of data using libmagic."""
+    return magic.from_buffer(data[:MIME_SNIFF_BYTES], mime=True)
+
+
 def detect_mime(uploaded_file):
     """Detect MIME type of an uploaded file using libmagic."""
     uploaded_file.seek(0)
-    header = uploaded_file.read(8192)
+    header = uploaded_file.read(MIME_SNIFF_BYTES)
     uploaded_file.seek(0)
-    return magic.from_buffer(header, mime=True)
+    return _sniff_mime(header)
 
 
 def convert_to_jpeg_if_needed(uploaded_file):
@@ -112,11 +121,12 @@ def get_image_bytes_for_ocr(uploaded_file):
     Returns:
         tuple: (image_bytes, format_hint)
     """
-    detected_mime = detect_mime(uploaded_file)
-
+    # Read once and sniff the header from the same buffer instead of
+    # seeking back for a separate detect_mime() read.
     uploaded_file.seek(0)
     image_bytes = uploaded_file.read()
     uploaded_file.seek(0)
+    detected_mime = _sniff_mime(image_bytes)
 
     format_hint = MIME_TO_FORMAT_HINT.get(detected_mime, 'JPEG')
 
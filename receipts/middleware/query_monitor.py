@@ -31,14 +31,14 @@ class QueryCountMiddleware:
         connection.queries_log.clear()
         
         # Track start state
-        start_time = time.time()
+        start_time = time.perf_counter()
         queries_before = len(connection.queries)
         
         # Process request
         response = self.get_response(request)
         
         # Calculate metrics
-        end_time = time.time()
+        end_time = time.perf_counter()
         queries_after = len(connection.queries)
         query_count = queries_after - queries_before
         duration_ms = (end_time - start_time) * 1000
@@ -78,13 +78,13 @@ def log_query_performance(func):
         if not settings.DEBUG:
             return func(*args, **kwargs)
             
-        start_time = time.time()
+        start_time = time.perf_counter()
         start_queries = len(connection.queries)
         
         try:
             result = func(*args, **kwargs)
         finally:
-            end_time = time.time()
+            end_time = time.perf_counter()
             end_queries = len(connection.queries)
             
             duration_ms = (end_time - start_time) * 1000
@@ -11,11 +11,12 @@ def receipt_state(receipt):
     is_corrected = (
         hasattr(receipt, 'ocr_result') and receipt.ocr_result.is_corrected()
     )
-    all_items = receipt.items.all()
-    fully_claimed = all(
+    # One query for items and one for their claims; no separate exists() probe
+    items = list(receipt.items.prefetch_related('claims'))
+    fully_claimed = bool(items) and all(
         sum(c.quantity_numerator for c in item.claims.all()) >= item.quantity_numerator
-        for item in all_items
-    ) if all_items.exists() else False
+        for item in items
+    )
     return {
         'finalized': receipt.is_finalized,
         'fully_claimed': fully_claimed,
@@ -20,6 +20,7 @@ from receipts.async_processor import (
     process_receipt_async,
     process_receipt_sync,
     create_placeholder_receipt,
+    processing_status_cache_key,
 )
 from receipts.image_storage import store_receipt_image, delete_receipt_image
 
@@ -70,6 +71,24 @@ class ReceiptService:
         """Get receipt by slug"""
         return self._get_by_slug(slug)
     
+    def get_processing_status_by_slug(self, slug: str, ttl: int = 0) -> Optional[Tuple[str, Optional[str]]]:
+        """Get (processing_status, processing_error) by slug, cached for ttl seconds"""
+        cache_key = processing_status_cache_key(slug)
+        if ttl:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        status = Receipt.objects.filter(slug=slug).values_list(
+            'processing_status', 'processing_error'
+        ).first()
+        
+        # add() rather than set(), so a poll that read the row before the OCR
+        # worker's save cannot overwrite the status the worker just cached
+        if ttl and status is not None:
+            cache.add(cache_key, status, ttl)
+        return status
+    
     def update_receipt(self, receipt_id: str, data: Dict, 
                       session_context: Dict) -> Dict:
         """
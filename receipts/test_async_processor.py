@@ -3,14 +3,15 @@ Tests for async_processor.py — specifically that OCR results
 create LineItems using quantity_numerator (not the removed quantity field)
 and that fractional Decimal conversions don't crash.
 """
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from decimal import Decimal
 from fractions import Fraction
 from unittest.mock import patch
 
 from .models import Receipt, LineItem, Claim
-from .async_processor import _process_receipt_worker
+from .async_processor import _process_receipt_worker, processing_status_cache_key
 
 
 class AsyncProcessorLineItemCreationTests(TestCase):
@@ -80,6 +81,21 @@ class AsyncProcessorLineItemCreationTests(TestCase):
         self.assertEqual(self.receipt.processing_status, 'failed')
 
 
+    @override_settings(PROCESSING_STATUS_CACHE_TTL=60)
+    @patch('receipts.async_processor.process_receipt_with_ocr')
+    def test_status_change_replaces_cached_status(self, mock_ocr):
+        """Pollers must not keep seeing a cached 'pending' after OCR finishes."""
+        mock_ocr.side_effect = RuntimeError("OCR exploded")
+        cache_key = processing_status_cache_key(self.receipt.slug)
+        cache.set(cache_key, ('pending', None), 60)
+
+        _process_receipt_worker(self.receipt.id, b'fake_image', 'JPEG')
+
+        self.assertEqual(cache.get(cache_key), (
+            'failed', "An unexpected error occurred during processing."
+        ))
+
+
 class FractionalDecimalConversionTests(TestCase):
     """Regression: Decimal(str(Fraction(1,2))) crashes. Ensure share calculations work."""
 
@@ -32,52 +32,53 @@ class ClaimTotalsByNameRepositoryTests(TestCase):
         )
         
         # Create line items
-        self.item1 = LineItem.objects.create(
-            receipt=self.receipt,
-            name="Pizza",
-            quantity_numerator=2,
-            unit_price=Decimal("25.00"),
-            total_price=Decimal("50.00"),
-            prorated_tax=Decimal("5.00"),
-            prorated_tip=Decimal("10.00")
-        )
-        
-        self.item2 = LineItem.objects.create(
-            receipt=self.receipt,
-            name="Salad",
-            quantity_numerator=1,
-            unit_price=Decimal("15.00"),
-            total_price=Decimal("15.00"),
-            prorated_tax=Decimal("1.50"),
-            prorated_tip=Decimal("3.00")
-        )
+        self.item1, self.item2 = LineItem.objects.bulk_create([
+            LineItem(
+                receipt=self.receipt,
+                name="Pizza",
+                quantity_numerator=2,
+                unit_price=Decimal("25.00"),
+                total_price=Decimal("50.00"),
+                prorated_tax=Decimal("5.00"),
+                prorated_tip=Decimal("10.00"),
+            ),
+            LineItem(
+                receipt=self.receipt,
+                name="Salad",
+                quantity_numerator=1,
+                unit_price=Decimal("15.00"),
+                total_price=Decimal("15.00"),
+                prorated_tax=Decimal("1.50"),
+                prorated_tip=Decimal("3.00"),
+            ),
+        ])
         
         # Create claims with SAME session but DIFFERENT names (the bug scenario)
         self.session_id = "test-session-123"
         
-        # Claims as "Kui"
-        self.claim1 = Claim.objects.create(
-            line_item=self.item1,
-            claimer_name="Kui",
-            quantity_numerator=1,
-            session_id=self.session_id,
-        )
-
-        # Claims as "Kui 5" (same session, different name)
-        self.claim2 = Claim.objects.create(
-            line_item=self.item2,
-            claimer_name="Kui 5",
-            quantity_numerator=1,
-            session_id=self.session_id,
-        )
-
-        # Claims from different session with same name
-        self.claim3 = Claim.objects.create(
-            line_item=self.item1,
-            claimer_name="Kui",
-            quantity_numerator=1,
-            session_id="different-session-456",
-        )
+        self.claim1, self.claim2, self.claim3 = Claim.objects.bulk_create([
+            # Claims as "Kui"
+            Claim(
+                line_item=self.item1,
+                claimer_name="Kui",
+                quantity_numerator=1,
+                session_id=self.session_id,
+            ),
+            # Claims as "Kui 5" (same session, different name)
+            Claim(
+                line_item=self.item2,
+                claimer_name="Kui 5",
+                quantity_numerator=1,
+                session_id=self.session_id,
+            ),
+            # Claims from different session with same name
+            Claim(
+                line_item=self.item1,
+                claimer_name="Kui",
+                quantity_numerator=1,
+                session_id="different-session-456",
+            ),
+        ])
     
     def test_get_claims_by_name_filters_correctly(self):
         """Test that get_claims_by_name only returns claims for specified name"""
@@ -133,59 +134,59 @@ class ClaimTotalsByNameServiceTests(TestCase):
         )
         
         # Create items with proper prorations
-        self.item1 = LineItem.objects.create(
-            receipt=self.receipt,
-            name="Burger",
-            quantity_numerator=1,
-            unit_price=Decimal("20.00"),
-            total_price=Decimal("20.00"),
-            prorated_tax=Decimal("2.00"),
-            prorated_tip=Decimal("4.00")
-        )
-        
-        self.item2 = LineItem.objects.create(
-            receipt=self.receipt,
-            name="Fries",
-            quantity_numerator=1,
-            unit_price=Decimal("10.00"),
-            total_price=Decimal("10.00"),
-            prorated_tax=Decimal("1.00"),
-            prorated_tip=Decimal("2.00")
-        )
-        
-        self.item3 = LineItem.objects.create(
-            receipt=self.receipt,
-            name="Drink",
-            quantity_numerator=1,
-            unit_price=Decimal("5.00"),
-            total_price=Decimal("5.00"),
-            prorated_tax=Decimal("0.50"),
-            prorated_tip=Decimal("1.00")
-        )
+        self.item1, self.item2, self.item3 = LineItem.objects.bulk_create([
+            LineItem(
+                receipt=self.receipt,
+                name="Burger",
+                quantity_numerator=1,
+                unit_price=Decimal("20.00"),
+                total_price=Decimal("20.00"),
+                prorated_tax=Decimal("2.00"),
+                prorated_tip=Decimal("4.00"),
+            ),
+            LineItem(
+                receipt=self.receipt,
+                name="Fries",
+                quantity_numerator=1,
+                unit_price=Decimal("10.00"),
+                total_price=Decimal("10.00"),
+                prorated_tax=Decimal("1.00"),
+                prorated_tip=Decimal("2.00"),
+            ),
+            LineItem(
+                receipt=self.receipt,
+                name="Drink",
+                quantity_numerator=1,
+                unit_price=Decimal("5.00"),
+                total_price=Decimal("5.00"),
+                prorated_tax=Decimal("0.50"),
+                prorated_tip=Decimal("1.00"),
+            ),
+        ])
         
         self.session_id = "test-session-789"
         
         # Create claims under different names but same session
-        Claim.objects.create(
-            line_item=self.item1,
-            claimer_name="Alice",
-            quantity_numerator=1,
-            session_id=self.session_id,
-        )
-
-        Claim.objects.create(
-            line_item=self.item2,
-            claimer_name="Alice 2",  # Different name, same session
-            quantity_numerator=1,
-            session_id=self.session_id,
-        )
-        
-        Claim.objects.create(
-            line_item=self.item3,
-            claimer_name="Alice",
-            quantity_numerator=1,
-            session_id=self.session_id,
-        )
+        Claim.objects.bulk_create([
+            Claim(
+                line_item=self.item1,
+                claimer_name="Alice",
+                quantity_numerator=1,
+                session_id=self.session_id,
+            ),
+            Claim(
+                line_item=self.item2,
+                claimer_name="Alice 2",  # Different name, same session
+                quantity_numerator=1,
+                session_id=self.session_id,
+            ),
+            Claim(
+                line_item=self.item3,
+                claimer_name="Alice",
+                quantity_numerator=1,
+                session_id=self.session_id,
+            ),
+        ])
     
     def test_calculate_name_total_single_name(self):
         """Test that calculate_name_total only sums claims for specified name"""
@@ -257,35 +258,35 @@ class ClaimTotalsIntegrationTests(TestCase):
         )
         
         # Create items similar to the bug screenshot
-        self.item1 = LineItem.objects.create(
-            receipt=self.receipt,
-            name="PALOMA",
-            quantity_numerator=1,
-            unit_price=Decimal("17.68"),
-            total_price=Decimal("17.68"),
-            prorated_tax=Decimal("0.00"),
-            prorated_tip=Decimal("0.00")
-        )
-        
-        self.item2 = LineItem.objects.create(
-            receipt=self.receipt,
-            name="HAPPY HOUR BEER",
-            quantity_numerator=1,
-            unit_price=Decimal("5.20"),
-            total_price=Decimal("5.20"),
-            prorated_tax=Decimal("0.00"),
-            prorated_tip=Decimal("0.00")
-        )
-        
-        self.item3 = LineItem.objects.create(
-            receipt=self.receipt,
-            name="WELL TEQUILA",
-            quantity_numerator=1,
-            unit_price=Decimal("5.20"),
-            total_price=Decimal("5.20"),
-            prorated_tax=Decimal("0.00"),
-            prorated_tip=Decimal("0.00")
-        )
+        self.item1, self.item2, self.item3 = LineItem.objects.bulk_create([
+            LineItem(
+                receipt=self.receipt,
+                name="PALOMA",
+                quantity_numerator=1,
+                unit_price=Decimal("17.68"),
+                total_price=Decimal("17.68"),
+                prorated_tax=Decimal("0.00"),
+                prorated_tip=Decimal("0.00"),
+            ),
+            LineItem(
+                receipt=self.receipt,
+                name="HAPPY HOUR BEER",
+                quantity_numerator=1,
+                unit_price=Decimal("5.20"),
+                total_price=Decimal("5.20"),
+                prorated_tax=Decimal("0.00"),
+                prorated_tip=Decimal("0.00"),
+            ),
+            LineItem(
+                receipt=self.receipt,
+                name="WELL TEQUILA",
+                quantity_numerator=1,
+                unit_price=Decimal("5.20"),
+                total_price=Decimal("5.20"),
+                prorated_tax=Decimal("0.00"),
+                prorated_tip=Decimal("0.00"),
+            ),
+        ])
     
     def test_bug_scenario_same_session_different_names(self):
         """Test the exact bug scenario: same session, forced to use different name"""
@@ -293,28 +294,28 @@ class ClaimTotalsIntegrationTests(TestCase):
         session = self.client.session
         session_key = session.session_key or session.save() or session.session_key
         
-        # Create claims as "Kui"
-        Claim.objects.create(
-            line_item=self.item1,
-            claimer_name="Kui",
-            quantity_numerator=1,
-            session_id=session_key,
-        )
-
-        # Later, same session but forced to use "Kui 5"
-        Claim.objects.create(
-            line_item=self.item2,
-            claimer_name="Kui 5",
-            quantity_numerator=1,
-            session_id=session_key,
-        )
-
-        Claim.objects.create(
-            line_item=self.item3,
-            claimer_name="Kui 5",
-            quantity_numerator=1,
-            session_id=session_key,
-        )
+        Claim.objects.bulk_create([
+            # Create claims as "Kui"
+            Claim(
+                line_item=self.item1,
+                claimer_name="Kui",
+                quantity_numerator=1,
+                session_id=session_key,
+            ),
+            # Later, same session but forced to use "Kui 5"
+            Claim(
+                line_item=self.item2,
+                claimer_name="Kui 5",
+                quantity_numerator=1,
+                session_id=session_key,
+            ),
+            Claim(
+                line_item=self.item3,
+                claimer_name="Kui 5",
+                quantity_numerator=1,
+                session_id=session_key,
+            ),
+        ])
 
         # Test name-based calculations
         service = ClaimService()
@@ -339,26 +340,26 @@ class ClaimTotalsIntegrationTests(TestCase):
         session_key = "test-session"
         
         # Create mixed claims
-        Claim.objects.create(
-            line_item=self.item1,
-            claimer_name="John",
-            quantity_numerator=1,
-            session_id=session_key,
-        )
-
-        Claim.objects.create(
-            line_item=self.item2,
-            claimer_name="John",
-            quantity_numerator=1,
-            session_id="different-session",
-        )
-        
-        Claim.objects.create(
-            line_item=self.item3,
-            claimer_name="Jane",
-            quantity_numerator=1,
-            session_id=session_key,
-        )
+        Claim.objects.bulk_create([
+            Claim(
+                line_item=self.item1,
+                claimer_name="John",
+                quantity_numerator=1,
+                session_id=session_key,
+            ),
+            Claim(
+                line_item=self.item2,
+                claimer_name="John",
+                quantity_numerator=1,
+                session_id="different-session",
+            ),
+            Claim(
+                line_item=self.item3,
+                claimer_name="Jane",
+                quantity_numerator=1,
+                session_id=session_key,
+            ),
+        ])
         
         service = ClaimService()
         participant_totals = service.get_participant_totals(self.receipt.id)
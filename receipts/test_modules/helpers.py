@@ -0,0 +1,20 @@
+"""Shared helpers for the receipts test suites."""
+
+from importlib import import_module
+
+from django.conf import settings
+from django.test import Client
+
+
+def client_with_receipt_session(receipt, **entry):
+    """Return a Client whose session already holds ``entry`` for ``receipt``.
+
+    Building the store directly saves it once, where ``client.session``
+    saves an empty session first and the caller then saves it again.
+    """
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session['receipts'] = {str(receipt.id): entry}
+    session.save()
+    client = Client()
+    client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+    return client
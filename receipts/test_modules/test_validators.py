@@ -1,4 +1,5 @@
 import resource
+from functools import lru_cache
 from django.test import TestCase
 from unittest.mock import patch
 from django.core.exceptions import ValidationError
@@ -9,8 +10,13 @@ from io import BytesIO
 from receipts.validators import FileUploadValidator
 
 
+@lru_cache(maxsize=None)
 def _make_image(fmt='JPEG', size=(1, 1), mode='RGB', exif=False):
-    """Create a small in-memory image in the given format."""
+    """Create a small in-memory image in the given format.
+
+    Cached: the returned bytes are immutable, so each distinct image is
+    encoded once per run instead of once per test.
+    """
     buf = BytesIO()
     img = Image.new(mode, size, color='white')
     save_kwargs = {}
@@ -176,13 +176,12 @@ class OCRResultSavedOnSuccessTests(TestCase):
         from receipts.async_processor import _process_receipt_worker
         _process_receipt_worker(str(receipt.id), b'fakeimage', 'JPEG')
 
-        self.assertTrue(
-            ReceiptOCRResult.objects.filter(receipt=receipt).exists()
-        )
-        ocr = ReceiptOCRResult.objects.get(receipt=receipt)
+        # get() already fails the test if no result was saved
+        ocr = ReceiptOCRResult.objects.prefetch_related('ocr_items').get(receipt=receipt)
         self.assertEqual(ocr.restaurant_name, 'Test Diner')
-        self.assertEqual(ocr.ocr_items.count(), 1)
-        self.assertEqual(ocr.ocr_items.first().name, 'Burger')
+        ocr_items = list(ocr.ocr_items.all())
+        self.assertEqual(len(ocr_items), 1)
+        self.assertEqual(ocr_items[0].name, 'Burger')
 
     @patch('receipts.async_processor.process_receipt_with_ocr')
     def test_ocr_result_not_created_on_failure(self, mock_ocr):
@@ -265,3 +264,20 @@ class ReceiptStateTests(TestCase):
 
         state = receipt_state(receipt)
         self.assertFalse(state['fully_claimed'])
+
+    def test_fully_claimed_query_count_does_not_grow_with_items(self):
+        from receipts.models import Claim
+        receipt = _make_receipt()
+        for _ in range(3):
+            item = _make_line_item(receipt)
+            Claim.objects.create(
+                line_item=item,
+                claimer_name='Bob',
+                quantity_numerator=item.quantity_numerator,
+                session_id='sess1',
+            )
+
+        # ocr_result lookup + items + prefetched claims
+        with self.assertNumQueries(3):
+            state = receipt_state(receipt)
+        self.assertTrue(state['fully_claimed'])
@@ -0,0 +1,116 @@
+"""
+Tests for the /status/<slug>/ endpoint polled by the edit page while OCR runs,
+plus the query budgets for the uploader's hot path.
+"""
+
+import json
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from receipts.async_processor import processing_status_cache_key
+from receipts.models import Receipt, LineItem
+from receipts.test_modules.helpers import client_with_receipt_session
+
+
+class ProcessingStatusViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.receipt = Receipt.objects.create(
+            uploader_name="Test User",
+            restaurant_name="Test Restaurant",
+            date=timezone.now(),
+            subtotal=Decimal("100.00"),
+            tax=Decimal("10.00"),
+            tip=Decimal("15.00"),
+            total=Decimal("125.00"),
+        )
+
+    def setUp(self):
+        # Status responses are cached per slug; start every test cold
+        cache.clear()
+
+    def test_check_processing_status(self):
+        url = reverse('check_processing_status', kwargs={'receipt_slug': self.receipt.slug})
+        Receipt.objects.filter(pk=self.receipt.pk).update(
+            processing_status='failed', processing_error='OCR exploded'
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), {
+            'status': 'failed',
+            'is_complete': False,
+            'error': 'OCR exploded',
+        })
+
+    @override_settings(PROCESSING_STATUS_CACHE_TTL=60)
+    def test_check_processing_status_is_cached_between_polls(self):
+        url = reverse('check_processing_status', kwargs={'receipt_slug': self.receipt.slug})
+
+        self.assertEqual(json.loads(self.client.get(url).content)['status'], 'pending')
+
+        # A write that bypasses the worker is not seen until the entry expires
+        Receipt.objects.filter(pk=self.receipt.pk).update(processing_status='completed')
+        self.assertEqual(json.loads(self.client.get(url).content)['status'], 'pending')
+
+        cache.delete(processing_status_cache_key(self.receipt.slug))
+        self.assertEqual(json.loads(self.client.get(url).content)['status'], 'completed')
+
+    def test_check_processing_status_nonexistent_receipt(self):
+        url = reverse('check_processing_status', kwargs={'receipt_slug': 'nonexistent-slug'})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+
+
+class EndpointQueryCountTests(TestCase):
+    """Query budgets for the uploader's hot path, to catch N+1 regressions.
+
+    Every budget includes the session read plus the savepoint-wrapped session
+    UPDATE (SESSION_SAVE_EVERY_REQUEST) - 4 queries.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.receipt = Receipt.objects.create(
+            uploader_name="Test User",
+            restaurant_name="Test Restaurant",
+            date=timezone.now(),
+            subtotal=Decimal("30.00"),
+            tax=Decimal("0.00"),
+            tip=Decimal("0.00"),
+            total=Decimal("30.00"),
+            processing_status='completed',
+        )
+        LineItem.objects.bulk_create([
+            LineItem(
+                receipt=cls.receipt,
+                name=name,
+                quantity_numerator=1,
+                unit_price=Decimal("10.00"),
+                total_price=Decimal("10.00")
+            )
+            for name in ("Burger", "Fries", "Shake")
+        ])
+
+    def setUp(self):
+        self.client = client_with_receipt_session(
+            self.receipt, is_uploader=True, edit_token='test-token'
+        )
+        cache.delete(processing_status_cache_key(self.receipt.slug))
+
+    def test_edit_page_query_count(self):
+        url = reverse('edit_receipt', kwargs={'receipt_slug': self.receipt.slug})
+        # receipt + items, independent of the number of items
+        with self.assertNumQueries(2 + 4):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(PROCESSING_STATUS_CACHE_TTL=0)
+    def test_processing_status_query_count(self):
+        url = reverse('check_processing_status', kwargs={'receipt_slug': self.receipt.slug})
+        with self.assertNumQueries(1 + 4):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
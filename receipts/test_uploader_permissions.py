@@ -23,12 +23,14 @@ class UploaderPermissionUnitTests(TestCase):
         self.uploader_name = "Test Uploader"
         self.other_viewer = "Other Viewer"
         
+        now = timezone.now()
+
         # Create finalized receipt
         self.finalized_receipt = Receipt.objects.create(
             uploader_name=self.uploader_name,
             restaurant_name="Test Restaurant",
-            date=timezone.now(),
-            expires_at=timezone.now() + timedelta(hours=24),
+            date=now,
+            expires_at=now + timedelta(hours=24),
             subtotal=Decimal('20.00'),
             tax=Decimal('2.00'),
             tip=Decimal('3.00'),
@@ -41,8 +43,8 @@ class UploaderPermissionUnitTests(TestCase):
         self.unfinalized_receipt = Receipt.objects.create(
             uploader_name=self.uploader_name,
             restaurant_name="Test Restaurant 2",
-            date=timezone.now(),
-            expires_at=timezone.now() + timedelta(hours=24),
+            date=now,
+            expires_at=now + timedelta(hours=24),
             subtotal=Decimal('15.00'),
             tax=Decimal('1.50'),
             tip=Decimal('2.00'),
@@ -909,9 +911,9 @@ class NameCollisionRegressionTests(TestCase):
         
         # Should show name collision page
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Name Already Taken')
-        self.assertContains(response, 'John')
-        self.assertContains(response, 'John 2')  # Suggested alternative
+        self.assertContains(response, b'Name Already Taken')
+        self.assertContains(response, b'John')
+        self.assertContains(response, b'John 2')  # Suggested alternative
         
         # Verify the viewer was NOT registered with the duplicate name
         from receipts.models import ActiveViewer
@@ -965,9 +967,9 @@ class NameCollisionRegressionTests(TestCase):
         
         # Should show name collision page
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Name Already Taken')
-        self.assertContains(response, 'Alice')
-        self.assertContains(response, 'Alice 2')  # Suggested alternative
+        self.assertContains(response, b'Name Already Taken')
+        self.assertContains(response, b'Alice')
+        self.assertContains(response, b'Alice 2')  # Suggested alternative
         
     def test_case_sensitive_name_handling(self):
         """Test that name collision is case-sensitive"""
@@ -992,7 +994,7 @@ class NameCollisionRegressionTests(TestCase):
         
         # Should be allowed (case-sensitive)
         self.assertEqual(response.status_code, 200)
-        self.assertNotContains(response, 'Name Already Taken')
+        self.assertNotContains(response, b'Name Already Taken')
         
         # Verify the viewer was registered with lowercase name
         from receipts.models import ActiveViewer
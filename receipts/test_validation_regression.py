@@ -3,6 +3,10 @@ Regression tests for validation bugs:
 1. Decimal(str(Fraction)) crashes for fractional item validation
 2. utils.js loaded twice causes SyntaxError (template test)
 """
+import re
+from pathlib import Path
+
+from django.conf import settings
 from django.test import TestCase
 from django.utils import timezone
 from decimal import Decimal
@@ -10,6 +14,22 @@ from decimal import Decimal
 from .models import Receipt, LineItem
 from .validation import validate_receipt_balance
 
+# Pre-parsed Decimal item, as InputValidator hands it to validate_receipt_balance
+_HALF_PIZZA = {
+    'name': 'Half Pizza',
+    'quantity_numerator': 1,
+    'quantity_denominator': 2,
+    'unit_price': Decimal('10.00'),
+    'total_price': Decimal('5.00'),
+}
+
+_UTILS_JS_LOAD_RE = re.compile(r"static\s+'js/utils\.js'")
+
+
+def _template_source(name):
+    """Read a project template's source without compiling it."""
+    return Path(settings.TEMPLATES[0]['DIRS'][0], name).read_text()
+
 
 class FractionalItemValidationTests(TestCase):
     """Decimal(str(Fraction(1,2))) crashes. Validation must handle fractional items."""
@@ -95,6 +115,23 @@ class FractionalItemValidationTests(TestCase):
         is_valid, errors = validate_receipt_balance(receipt_data)
         self.assertTrue(is_valid)
 
+    def test_validate_decimal_inputs(self):
+        """Already-parsed Decimal values validate the same as strings."""
+        receipt_data = {
+            'subtotal': Decimal('5.00'),
+            'tax': Decimal('0.50'),
+            'tip': Decimal('1.00'),
+            'total': Decimal('6.50'),
+            'items': [_HALF_PIZZA],
+        }
+        is_valid, errors = validate_receipt_balance(receipt_data)
+        self.assertTrue(is_valid)
+
+        receipt_data['items'] = [dict(_HALF_PIZZA, total_price=Decimal('7.00'))]
+        is_valid, errors = validate_receipt_balance(receipt_data)
+        self.assertFalse(is_valid)
+        self.assertIn('items', errors)
+
     def test_validate_integer_quantity_still_works(self):
         """Integer quantity (denominator=1) should still validate correctly."""
         receipt_data = {
@@ -122,21 +159,15 @@ class DoubleScriptLoadTest(TestCase):
 
     def test_edit_page_no_duplicate_utils(self):
         """edit_async.html extra_scripts should not include utils.js."""
-        from django.template.loader import get_template
-        template = get_template('receipts/edit_async.html')
-        source = template.template.source
+        source = _template_source('receipts/edit_async.html')
         # Count occurrences of utils.js in the template source
-        import re
-        utils_loads = re.findall(r"static\s+'js/utils\.js'", source)
+        utils_loads = _UTILS_JS_LOAD_RE.findall(source)
         self.assertEqual(len(utils_loads), 0,
                          "edit_async.html should not load utils.js (base.html already loads it)")
 
     def test_view_page_no_duplicate_utils(self):
         """view.html extra_scripts should not include utils.js."""
-        from django.template.loader import get_template
-        template = get_template('receipts/view.html')
-        source = template.template.source
-        import re
-        utils_loads = re.findall(r"static\s+'js/utils\.js'", source)
+        source = _template_source('receipts/view.html')
+        utils_loads = _UTILS_JS_LOAD_RE.findall(source)
         self.assertEqual(len(utils_loads), 0,
                          "view.html should not load utils.js (base.html already loads it)")
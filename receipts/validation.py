@@ -7,12 +7,24 @@ the TOTAL_CORRECTION implementation for handling OCR discrepancies.
 """
 from decimal import Decimal, ROUND_HALF_UP
 from fractions import Fraction
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+_CENT = Decimal('0.01')
 
 
 def round_money(value: Decimal) -> Decimal:
     """Round a decimal value to 2 decimal places using banker's rounding"""
-    return value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    return value.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Decimal(str(value)), skipping the string round-trip for Decimal input.
+
+    InputValidator already hands us Decimals, so re-parsing them is wasted work.
+    """
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
 
 
 def validate_receipt_balance(receipt_data: Dict) -> Tuple[bool, Optional[Dict]]:
@@ -39,10 +51,10 @@ def validate_receipt_balance(receipt_data: Dict) -> Tuple[bool, Optional[Dict]]:
     
     try:
         # Convert to Decimal for precise calculations
-        subtotal = Decimal(str(receipt_data.get('subtotal', 0)))
-        tax = Decimal(str(receipt_data.get('tax', 0)))
-        tip = Decimal(str(receipt_data.get('tip', 0)))
-        total = Decimal(str(receipt_data.get('total', 0)))
+        subtotal = _to_decimal(receipt_data.get('subtotal', 0))
+        tax = _to_decimal(receipt_data.get('tax', 0))
+        tip = _to_decimal(receipt_data.get('tip', 0))
+        total = _to_decimal(receipt_data.get('total', 0))
         items = receipt_data.get('items', [])
         
         # Validate individual item calculations
@@ -56,13 +68,13 @@ def validate_receipt_balance(receipt_data: Dict) -> Tuple[bool, Optional[Dict]]:
             den = int(item.get('quantity_denominator', 1))
             quantity = Fraction(num, den)
 
-            unit_price = Decimal(str(item.get('unit_price', 0)))
-            item_total = Decimal(str(item.get('total_price', 0)))
+            unit_price = _to_decimal(item.get('unit_price', 0))
+            item_total = _to_decimal(item.get('total_price', 0))
 
             expected_total = (Decimal(quantity.numerator) / Decimal(quantity.denominator)) * unit_price
 
             # Allow for small rounding differences (within 1 cent)
-            if abs(expected_total - item_total) > Decimal('0.01'):
+            if abs(expected_total - item_total) > _CENT:
                 if 'items' not in errors:
                     errors['items'] = []
                 qty_display = f"{num}/{den}" if den > 1 else str(num)
@@ -75,12 +87,12 @@ def validate_receipt_balance(receipt_data: Dict) -> Tuple[bool, Optional[Dict]]:
             items_sum += item_total
         
         # Check if items sum matches subtotal (allow 1 cent tolerance for rounding)
-        if abs(items_sum - subtotal) > Decimal('0.01'):
+        if abs(items_sum - subtotal) > _CENT:
             errors['subtotal'] = f"Subtotal ${subtotal:.2f} doesn't match sum of items ${items_sum:.2f}"
         
         # Check if subtotal + tax + tip = total (allow 1 cent tolerance)
         calculated_total = subtotal + tax + tip
-        if abs(calculated_total - total) > Decimal('0.01'):
+        if abs(calculated_total - total) > _CENT:
             errors['total'] = f"Total ${total:.2f} doesn't match subtotal (${subtotal:.2f}) + tax (${tax:.2f}) + tip (${tip:.2f}) = ${calculated_total:.2f}"
         
         # Check for negative values
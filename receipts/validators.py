@@ -117,14 +117,20 @@ class FileUploadValidator:
     @classmethod
     def generate_safe_filename(cls, uploaded_file):
         """Generate a secure filename based on file content hash and detected MIME type."""
-        uploaded_file.seek(0)
-        file_content = uploaded_file.read()
+        # Hash chunk by chunk so large uploads are never copied into one
+        # bytes object; libmagic only needs the leading bytes.
+        hasher = hashlib.sha256()
+        header = b''
+        for chunk in uploaded_file.chunks():
+            if not header:
+                header = chunk[:8192]
+            hasher.update(chunk)
         uploaded_file.seek(0)
 
-        file_hash = hashlib.sha256(file_content).hexdigest()[:16]
+        file_hash = hasher.hexdigest()[:16]
 
         # Determine extension from actual content, not the user-supplied filename
-        detected_mime = magic.from_buffer(file_content, mime=True)
+        detected_mime = magic.from_buffer(header, mime=True)
         extension = cls.MIME_TO_EXTENSION.get(detected_mime, 'jpg')
 
         from django.utils import timezone
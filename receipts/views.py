@@ -9,6 +9,7 @@ from django.conf import settings
 from decimal import Decimal
 import json
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,8 @@ receipt_service = ReceiptService()
 claim_service = ClaimService()
 validator = ValidationPipeline()
 
+_VENMO_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]{5,30}$')
+
 
 def index(request):
     """Home page"""
@@ -46,12 +49,11 @@ def upload_receipt(request):
     receipt_image = request.FILES.get('receipt_image')
 
     # Validate and clean venmo username
-    import re
     venmo_raw = request.POST.get('venmo_username', '').strip()
     venmo_username = ''
     if venmo_raw:
         venmo_clean = venmo_raw.lstrip('@')
-        if re.match(r'^[a-zA-Z0-9_-]{5,30}$', venmo_clean):
+        if _VENMO_USERNAME_RE.match(venmo_clean):
             venmo_username = venmo_clean
 
     try:
@@ -214,12 +216,11 @@ def view_receipt(request, receipt_slug):
             name = request.POST.get('viewer_name', '').strip()
 
             # Validate and clean venmo username (same logic as upload)
-            import re
             viewer_venmo_raw = request.POST.get('viewer_venmo', '').strip()
             viewer_venmo = ''
             if viewer_venmo_raw:
                 venmo_clean = viewer_venmo_raw.lstrip('@')
-                if venmo_clean and re.match(r'^[a-zA-Z0-9_-]{5,30}$', venmo_clean):
+                if venmo_clean and _VENMO_USERNAME_RE.match(venmo_clean):
                     viewer_venmo = venmo_clean
 
             try:
@@ -445,19 +446,25 @@ def subdivide_item(request, receipt_slug):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+def _processing_status_payload(processing_status, processing_error):
+    return {
+        'status': processing_status,
+        'is_complete': processing_status == 'completed',
+        'error': processing_error if processing_status == 'failed' else None
+    }
+
+
 @require_http_methods(["GET"])
 def check_processing_status(request, receipt_slug):
     """Check if receipt OCR processing is complete"""
-    receipt = receipt_service.get_receipt_by_slug(receipt_slug)
+    status = receipt_service.get_processing_status_by_slug(
+        receipt_slug, ttl=settings.PROCESSING_STATUS_CACHE_TTL
+    )
     
-    if not receipt:
+    if not status:
         return JsonResponse({'error': 'Receipt not found'}, status=404)
     
-    return JsonResponse({
-        'status': receipt.processing_status,
-        'is_complete': receipt.processing_status == 'completed',
-        'error': receipt.processing_error if receipt.processing_status == 'failed' else None
-    })
+    return JsonResponse(_processing_status_payload(*status))
 
 
 @rate_limit_view